@@ -5,10 +5,14 @@ Exports Bitcoin node metrics for Prometheus monitoring
 """
 
 import os
+import math
 import time
-import json
-import requests
-from prometheus_client import start_http_server, Gauge, Counter, Info
+import asyncio
+import collections
+import threading
+import aiohttp
+import orjson
+from prometheus_client import start_http_server, CollectorRegistry, Gauge, Counter, Info
 
 # Configuration from environment
 RPC_HOST = os.getenv('BITCOIN_RPC_HOST', 'bitcoind')
@@ -17,70 +21,193 @@ RPC_USER = os.getenv('BITCOIN_RPC_USER', 'admin')
 RPC_PASS = os.getenv('BITCOIN_RPC_PASS', 'mysecretpassword123')
 EXPORTER_PORT = int(os.getenv('EXPORTER_PORT', '9332'))
 SCRAPE_INTERVAL = int(os.getenv('SCRAPE_INTERVAL', '15'))
+TXOUTSET_REFRESH_SEC = int(os.getenv('TXOUTSET_REFRESH_SEC', '600'))
+EXTERNAL_REFRESH_SEC = int(os.getenv('EXTERNAL_REFRESH_SEC', '60'))
+PEERINFO_REFRESH_SEC = int(os.getenv('PEERINFO_REFRESH_SEC', str(4 * SCRAPE_INTERVAL)))
+
+# Shared aiohttp session, created once in main_async(). Its connector
+# keeps keep-alive sockets pooled, so no TCP (or TLS for the external
+# API) handshake is paid per call.
+SESSION = None
+
+# Event loop running in the main thread; the scrape trigger below
+# schedules refreshes onto it from the metrics server thread.
+LOOP = None
+
+# Basic auth header is static, so encode it once at import instead of
+# re-encoding credentials on every request
+RPC_HEADERS = {
+    'content-type': 'application/json',
+    'Authorization': aiohttp.BasicAuth(RPC_USER, RPC_PASS).encode(),
+}
+RPC_TIMEOUT = aiohttp.ClientTimeout(total=30)
+EXTERNAL_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Dedicated registry so the scrape trigger below is collected before the
+# metric objects and a /metrics GET always sees freshly set values
+REGISTRY = CollectorRegistry()
+
+
+class ScrapeTrigger:
+    """Refreshes the metrics lazily when Prometheus scrapes /metrics
+
+    Registered ahead of the metric objects, so its collect() runs first
+    on each exposition and the gauges then report the values it just
+    set. Refreshes are gated by SCRAPE_INTERVAL so a burst of scrapes
+    doesn't thundering-herd bitcoind, and nothing is fetched at all
+    while nobody is scraping.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_refresh = None
+
+    def collect(self):
+        with self._lock:
+            now = time.monotonic()
+            if LOOP is not None and (self._last_refresh is None
+                                     or now - self._last_refresh >= SCRAPE_INTERVAL):
+                future = asyncio.run_coroutine_threadsafe(collect_metrics(), LOOP)
+                try:
+                    future.result(timeout=RPC_TIMEOUT.total)
+                    # Anchor the gate at the refresh start, not its end,
+                    # so the effective cadence doesn't drift by however
+                    # long the collection itself took
+                    self._last_refresh = now
+                    duration = time.monotonic() - now
+                    SCRAPE_DURATION.set(duration)
+                    if duration > SCRAPE_INTERVAL:
+                        SCRAPE_OVERRUNS.inc()
+                except Exception as e:
+                    print(f"Error collecting metrics: {e}")
+                    RPC_ERRORS.inc()
+        return ()
+
+    def describe(self):
+        return ()
+
+
+REGISTRY.register(ScrapeTrigger())
 
 # Prometheus metrics
 # Blockchain info
-BLOCK_HEIGHT = Gauge('bitcoin_block_height', 'Current block height of the node')
-BLOCK_HEADERS = Gauge('bitcoin_block_headers', 'Number of block headers')
-VERIFICATION_PROGRESS = Gauge('bitcoin_verification_progress', 'Blockchain verification progress (0-1)')
-CHAIN_SIZE_BYTES = Gauge('bitcoin_chain_size_bytes', 'Size of blockchain on disk in bytes')
-DIFFICULTY = Gauge('bitcoin_difficulty', 'Current mining difficulty')
-CHAIN_WORK = Gauge('bitcoin_chain_work', 'Total chain work (log2)')
+BLOCK_HEIGHT = Gauge('bitcoin_block_height', 'Current block height of the node', registry=REGISTRY)
+BLOCK_HEADERS = Gauge('bitcoin_block_headers', 'Number of block headers', registry=REGISTRY)
+VERIFICATION_PROGRESS = Gauge('bitcoin_verification_progress', 'Blockchain verification progress (0-1)', registry=REGISTRY)
+CHAIN_SIZE_BYTES = Gauge('bitcoin_chain_size_bytes', 'Size of blockchain on disk in bytes', registry=REGISTRY)
+DIFFICULTY = Gauge('bitcoin_difficulty', 'Current mining difficulty', registry=REGISTRY)
+CHAIN_WORK = Gauge('bitcoin_chain_work', 'Total chain work (log2)', registry=REGISTRY)
 
 # Network info
-CONNECTIONS_IN = Gauge('bitcoin_connections_in', 'Number of inbound connections')
-CONNECTIONS_OUT = Gauge('bitcoin_connections_out', 'Number of outbound connections')
-CONNECTIONS_TOTAL = Gauge('bitcoin_connections_total', 'Total number of connections')
-NETWORK_BYTES_RECV = Gauge('bitcoin_network_bytes_recv_total', 'Total bytes received')
-NETWORK_BYTES_SENT = Gauge('bitcoin_network_bytes_sent_total', 'Total bytes sent')
+CONNECTIONS_IN = Gauge('bitcoin_connections_in', 'Number of inbound connections', registry=REGISTRY)
+CONNECTIONS_OUT = Gauge('bitcoin_connections_out', 'Number of outbound connections', registry=REGISTRY)
+CONNECTIONS_TOTAL = Gauge('bitcoin_connections_total', 'Total number of connections', registry=REGISTRY)
+NETWORK_BYTES_RECV = Gauge('bitcoin_network_bytes_recv_total', 'Total bytes received', registry=REGISTRY)
+NETWORK_BYTES_SENT = Gauge('bitcoin_network_bytes_sent_total', 'Total bytes sent', registry=REGISTRY)
 
 # Mempool info
-MEMPOOL_SIZE = Gauge('bitcoin_mempool_size', 'Number of transactions in mempool')
-MEMPOOL_BYTES = Gauge('bitcoin_mempool_bytes', 'Size of mempool in bytes')
-MEMPOOL_USAGE = Gauge('bitcoin_mempool_usage', 'Total memory usage for mempool')
-MEMPOOL_MIN_FEE = Gauge('bitcoin_mempool_min_fee', 'Minimum fee rate for tx to be accepted')
+MEMPOOL_SIZE = Gauge('bitcoin_mempool_size', 'Number of transactions in mempool', registry=REGISTRY)
+MEMPOOL_BYTES = Gauge('bitcoin_mempool_bytes', 'Size of mempool in bytes', registry=REGISTRY)
+MEMPOOL_USAGE = Gauge('bitcoin_mempool_usage', 'Total memory usage for mempool', registry=REGISTRY)
+MEMPOOL_MIN_FEE = Gauge('bitcoin_mempool_min_fee', 'Minimum fee rate for tx to be accepted', registry=REGISTRY)
 
 # Peer info
-PEER_COUNT_BY_VERSION = Gauge('bitcoin_peer_count_by_version', 'Number of peers by version', ['version'])
+PEER_COUNT_BY_VERSION = Gauge('bitcoin_peer_count_by_version', 'Number of peers by version', ['version'], registry=REGISTRY)
 
 # External blockchain height (from blockchain.info API)
-EXTERNAL_BLOCK_HEIGHT = Gauge('bitcoin_external_block_height', 'Current block height from external API')
-SYNC_LAG = Gauge('bitcoin_sync_lag', 'Blocks behind external chain (external - local)')
+EXTERNAL_BLOCK_HEIGHT = Gauge('bitcoin_external_block_height', 'Current block height from external API', registry=REGISTRY)
+SYNC_LAG = Gauge('bitcoin_sync_lag', 'Blocks behind external chain (external - local)', registry=REGISTRY)
 
 # Node info
-NODE_INFO = Info('bitcoin_node', 'Bitcoin node information')
+NODE_INFO = Info('bitcoin_node', 'Bitcoin node information', registry=REGISTRY)
 
 # Version metrics (numeric for easier display)
-BITCOIN_VERSION = Gauge('bitcoin_version', 'Bitcoin Core version as number (e.g., 300200 for 30.2.0)')
-BITCOIN_VERSION_MAJOR = Gauge('bitcoin_version_major', 'Bitcoin Core major version')
-BITCOIN_VERSION_MINOR = Gauge('bitcoin_version_minor', 'Bitcoin Core minor version')
-PROTOCOL_VERSION = Gauge('bitcoin_protocol_version', 'Bitcoin protocol version')
+BITCOIN_VERSION = Gauge('bitcoin_version', 'Bitcoin Core version as number (e.g., 300200 for 30.2.0)', registry=REGISTRY)
+BITCOIN_VERSION_MAJOR = Gauge('bitcoin_version_major', 'Bitcoin Core major version', registry=REGISTRY)
+BITCOIN_VERSION_MINOR = Gauge('bitcoin_version_minor', 'Bitcoin Core minor version', registry=REGISTRY)
+PROTOCOL_VERSION = Gauge('bitcoin_protocol_version', 'Bitcoin protocol version', registry=REGISTRY)
 
 # Error counter
-RPC_ERRORS = Counter('bitcoin_rpc_errors_total', 'Total number of RPC errors')
+RPC_ERRORS = Counter('bitcoin_rpc_errors_total', 'Total number of RPC errors', registry=REGISTRY)
+
+# Collection timing
+SCRAPE_DURATION = Gauge('bitcoin_scrape_duration_seconds', 'Duration of the last metrics refresh', registry=REGISTRY)
+SCRAPE_OVERRUNS = Counter('bitcoin_scrape_overruns_total', 'Number of refreshes that took longer than SCRAPE_INTERVAL', registry=REGISTRY)
+
+# Age of TTL-cached values, for observability of the slow-refresh calls
+CACHE_REFRESH_AGE = Gauge('bitcoin_cache_refresh_age_seconds',
+                          'Seconds since last successful refresh of a TTL-cached call',
+                          ['call'], registry=REGISTRY)
+
+
+def ttl_cache(ttl_seconds):
+    """Cache the wrapped function's result for ttl_seconds
+
+    Used for calls that are too expensive to run every scrape
+    (gettxoutsetinfo walks the whole UTXO set; the external height API is
+    rate-limited third-party traffic). Failed calls (None) are not
+    cached, so the next scrape retries.
+    """
+    def decorator(func):
+        cache = {}
+        age_gauge = CACHE_REFRESH_AGE.labels(call=func.__name__)
+
+        async def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            entry = cache.get(func.__name__)
+            if entry is None or now - entry[1] >= ttl_seconds:
+                value = await func(*args, **kwargs)
+                if value is not None:
+                    entry = (value, now)
+                    cache[func.__name__] = entry
+            if entry is None:
+                return None
+            age_gauge.set(time.monotonic() - entry[1])
+            return entry[0]
+
+        return wrapper
+    return decorator
+
+
+# Serialized payloads for the param-less methods called every scrape, so
+# the dict build + serialization happens once per method
+_PAYLOAD_CACHE = {}
+
+
+def _rpc_payload(method, params):
+    if params:
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": "exporter",
+            "method": method,
+            "params": params
+        })
+
+    body = _PAYLOAD_CACHE.get(method)
+    if body is None:
+        body = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": "exporter",
+            "method": method,
+            "params": []
+        })
+        _PAYLOAD_CACHE[method] = body
+    return body
 
 
-def rpc_call(method, params=None):
+async def rpc_call(method, params=None):
     """Make RPC call to Bitcoin node"""
     url = f"http://{RPC_HOST}:{RPC_PORT}"
-    headers = {'content-type': 'application/json'}
-    payload = {
-        "jsonrpc": "2.0",
-        "id": "exporter",
-        "method": method,
-        "params": params or []
-    }
 
     try:
-        response = requests.post(
+        async with SESSION.post(
             url,
-            data=json.dumps(payload),
-            headers=headers,
-            auth=(RPC_USER, RPC_PASS),
-            timeout=30
-        )
-        response.raise_for_status()
-        result = response.json()
+            data=_rpc_payload(method, params),
+            headers=RPC_HEADERS,
+            timeout=RPC_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            result = orjson.loads(await response.read())
         if 'error' in result and result['error']:
             raise Exception(f"RPC Error: {result['error']}")
         return result.get('result')
@@ -90,89 +217,126 @@ def rpc_call(method, params=None):
         return None
 
 
-def get_external_block_height():
-    """Get current block height from blockchain.info API"""
-    try:
-        response = requests.get(
-            'https://blockchain.info/q/getblockcount',
-            timeout=10
-        )
+# External APIs that report the current chain tip as a plain integer
+EXTERNAL_HEIGHT_URLS = (
+    'https://blockchain.info/q/getblockcount',
+    'https://blockstream.info/api/blocks/tip/height',
+    'https://mempool.space/api/blocks/tip/height',
+)
+
+
+async def _fetch_height(url):
+    async with SESSION.get(url, timeout=EXTERNAL_TIMEOUT) as response:
         response.raise_for_status()
-        return int(response.text)
-    except Exception as e:
-        print(f"Failed to get external block height: {e}")
+        return int(await response.text())
+
+
+@ttl_cache(EXTERNAL_REFRESH_SEC)
+async def get_external_block_height():
+    """Get current block height from external APIs
+
+    All providers are queried concurrently and the first successful
+    reply wins, so one slow or down provider can't hold up the scrape.
+    The losing requests are cancelled.
+    """
+    tasks = [
+        asyncio.ensure_future(_fetch_height(url))
+        for url in EXTERNAL_HEIGHT_URLS
+    ]
+    try:
+        for future in asyncio.as_completed(tasks):
+            try:
+                return await future
+            except Exception as e:
+                print(f"Failed to get external block height: {e}")
         return None
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
-def collect_blockchain_info():
-    """Collect blockchain information"""
-    info = rpc_call('getblockchaininfo')
+def update_blockchain_info(info):
+    """Update blockchain metrics from a getblockchaininfo result"""
     if info:
         BLOCK_HEIGHT.set(info.get('blocks', 0))
         BLOCK_HEADERS.set(info.get('headers', 0))
         VERIFICATION_PROGRESS.set(info.get('verificationprogress', 0))
         DIFFICULTY.set(info.get('difficulty', 0))
 
-        # Calculate log2 of chainwork for reasonable metric value
+        # Calculate log2 of chainwork for reasonable metric value.
+        # chainwork is a 256-bit integer; shift it down to float
+        # precision first so math.log2 never sees a bignum.
         chainwork_hex = info.get('chainwork', '0')
         if chainwork_hex:
             chainwork_int = int(chainwork_hex, 16)
             if chainwork_int > 0:
-                import math
-                CHAIN_WORK.set(math.log2(chainwork_int))
-
-        # Get chain size
-        size_info = rpc_call('gettxoutsetinfo')
-        if size_info:
-            CHAIN_SIZE_BYTES.set(size_info.get('disk_size', 0))
+                shift = max(0, chainwork_int.bit_length() - 53)
+                CHAIN_WORK.set(math.log2(chainwork_int >> shift) + shift)
 
         return info.get('blocks', 0)
     return None
 
 
-def collect_network_info():
-    """Collect network information"""
-    info = rpc_call('getnetworkinfo')
+@ttl_cache(TXOUTSET_REFRESH_SEC)
+async def get_txoutset_info():
+    """Fetch UTXO set statistics (slow; refreshed on its own TTL)"""
+    return await rpc_call('gettxoutsetinfo')
+
+
+def update_utxo_set_info(size_info):
+    """Update UTXO set metrics from a gettxoutsetinfo result"""
+    if size_info:
+        CHAIN_SIZE_BYTES.set(size_info.get('disk_size', 0))
+
+
+# Version last written to the version metrics; they only change when the
+# node is restarted, so skip rebuilding them on every scrape
+_LAST_VERSION = None
+
+
+def update_network_info(info, totals):
+    """Update network metrics from getnetworkinfo/getnettotals results"""
+    global _LAST_VERSION
+
     if info:
         CONNECTIONS_IN.set(info.get('connections_in', 0))
         CONNECTIONS_OUT.set(info.get('connections_out', 0))
         CONNECTIONS_TOTAL.set(info.get('connections', 0))
 
-        # Version info
+        # Version info (static for the lifetime of the bitcoind process)
         version = info.get('version', 0)
-        protocol_version = info.get('protocolversion', 0)
-        subversion = info.get('subversion', '')
-
-        # Set version metrics
-        BITCOIN_VERSION.set(version)
-        PROTOCOL_VERSION.set(protocol_version)
-
-        # Parse version: 300200 -> major=30, minor=2
-        # Bitcoin Core version format: MMmmpp (Major, minor, patch) * 10000
-        if version > 0:
-            major = version // 10000
-            minor = (version % 10000) // 100
-            BITCOIN_VERSION_MAJOR.set(major)
-            BITCOIN_VERSION_MINOR.set(minor)
-
-        NODE_INFO.info({
-            'version': str(version),
-            'version_string': f"{version // 10000}.{(version % 10000) // 100}.{version % 100}",
-            'subversion': subversion,
-            'protocol_version': str(protocol_version),
-            'network': 'mainnet'
-        })
+        if version != _LAST_VERSION:
+            protocol_version = info.get('protocolversion', 0)
+            subversion = info.get('subversion', '')
+
+            # Set version metrics
+            BITCOIN_VERSION.set(version)
+            PROTOCOL_VERSION.set(protocol_version)
+
+            # Parse version: 300200 -> major=30, minor=2
+            # Bitcoin Core version format: MMmmpp (Major, minor, patch) * 10000
+            if version > 0:
+                major = version // 10000
+                minor = (version % 10000) // 100
+                BITCOIN_VERSION_MAJOR.set(major)
+                BITCOIN_VERSION_MINOR.set(minor)
+
+            NODE_INFO.info({
+                'version': str(version),
+                'version_string': f"{version // 10000}.{(version % 10000) // 100}.{version % 100}",
+                'subversion': subversion,
+                'protocol_version': str(protocol_version),
+                'network': 'mainnet'
+            })
+            _LAST_VERSION = version
 
-    # Get network totals
-    totals = rpc_call('getnettotals')
     if totals:
         NETWORK_BYTES_RECV.set(totals.get('totalbytesrecv', 0))
         NETWORK_BYTES_SENT.set(totals.get('totalbytessent', 0))
 
 
-def collect_mempool_info():
-    """Collect mempool information"""
-    info = rpc_call('getmempoolinfo')
+def update_mempool_info(info):
+    """Update mempool metrics from a getmempoolinfo result"""
     if info:
         MEMPOOL_SIZE.set(info.get('size', 0))
         MEMPOOL_BYTES.set(info.get('bytes', 0))
@@ -180,22 +344,54 @@ def collect_mempool_info():
         MEMPOOL_MIN_FEE.set(info.get('mempoolminfee', 0))
 
 
-def collect_peer_info():
-    """Collect peer information"""
-    peers = rpc_call('getpeerinfo')
-    if peers:
-        version_counts = {}
-        for peer in peers:
-            version = peer.get('subver', 'unknown')
-            version_counts[version] = version_counts.get(version, 0) + 1
+@ttl_cache(PEERINFO_REFRESH_SEC)
+async def get_peer_info():
+    """Fetch the peer list (largest RPC reply; refreshed on its own TTL)
+
+    Only the per-version breakdown comes from here, and peer version
+    distribution changes slowly, so the full peer list doesn't need
+    fetching and parsing every scrape. Connection totals stay fresh via
+    getnetworkinfo.
+    """
+    return await rpc_call('getpeerinfo')
+
+
+# Peer versions seen on the previous scrape, so stale label children can
+# be dropped instead of accumulating forever
+_PREV_VERSIONS = set()
+
+# Bound label children of PEER_COUNT_BY_VERSION, so persistent versions
+# don't pay the .labels() lookup on every scrape
+_PEER_LABEL_CACHE = {}
+
+
+def update_peer_info(peers):
+    """Update peer metrics from a getpeerinfo result"""
+    global _PREV_VERSIONS
+
+    if peers is None:
+        return
+
+    version_counts = collections.Counter(
+        peer.get('subver', 'unknown') for peer in peers
+    )
 
-        for version, count in version_counts.items():
-            PEER_COUNT_BY_VERSION.labels(version=version).set(count)
+    for version in _PREV_VERSIONS - version_counts.keys():
+        PEER_COUNT_BY_VERSION.remove(version)
+        _PEER_LABEL_CACHE.pop(version, None)
 
+    for version, count in version_counts.items():
+        child = _PEER_LABEL_CACHE.get(version)
+        if child is None:
+            child = PEER_COUNT_BY_VERSION.labels(version=version)
+            _PEER_LABEL_CACHE[version] = child
+        child.set(count)
 
-def collect_external_height(local_height):
-    """Collect external block height and calculate sync lag"""
-    external_height = get_external_block_height()
+    _PREV_VERSIONS = set(version_counts)
+
+
+def update_external_height(external_height, local_height):
+    """Update external block height and calculate sync lag"""
     if external_height:
         EXTERNAL_BLOCK_HEIGHT.set(external_height)
         if local_height:
@@ -203,37 +399,62 @@ def collect_external_height(local_height):
             SYNC_LAG.set(max(0, lag))
 
 
-def collect_metrics():
+async def collect_metrics():
     """Collect all metrics"""
     print("Collecting metrics...")
 
-    local_height = collect_blockchain_info()
-    collect_network_info()
-    collect_mempool_info()
-    collect_peer_info()
-    collect_external_height(local_height)
+    # Fire the independent calls concurrently on the event loop; scrape
+    # wall time collapses to the slowest single call instead of the sum.
+    (blockchain_info, network_info, net_totals, mempool_info, peers,
+     size_info, external_height) = await asyncio.gather(
+        rpc_call('getblockchaininfo'),
+        rpc_call('getnetworkinfo'),
+        rpc_call('getnettotals'),
+        rpc_call('getmempoolinfo'),
+        get_peer_info(),
+        get_txoutset_info(),
+        get_external_block_height(),
+    )
+
+    local_height = update_blockchain_info(blockchain_info)
+    update_network_info(network_info, net_totals)
+    update_mempool_info(mempool_info)
+    update_peer_info(peers)
+    update_utxo_set_info(size_info)
+    update_external_height(external_height, local_height)
 
     print(f"Metrics collected. Local height: {local_height}")
 
 
-def main():
-    """Main function"""
+async def main_async():
+    """Set up the shared session and serve until stopped"""
+    global SESSION, LOOP
+
     print(f"Starting Bitcoin Prometheus Exporter on port {EXPORTER_PORT}")
     print(f"Connecting to Bitcoin RPC at {RPC_HOST}:{RPC_PORT}")
 
-    # Start HTTP server for Prometheus
-    start_http_server(EXPORTER_PORT)
-    print(f"Exporter running on http://0.0.0.0:{EXPORTER_PORT}/metrics")
+    LOOP = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+    # Neither bitcoind nor the height APIs use cookies; a DummyCookieJar
+    # skips the per-request cookie filtering and update passes
+    async with aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar()
+    ) as session:
+        SESSION = session
 
-    # Collect metrics in a loop
-    while True:
-        try:
-            collect_metrics()
-        except Exception as e:
-            print(f"Error collecting metrics: {e}")
-            RPC_ERRORS.inc()
+        # Start HTTP server for Prometheus (runs in its own thread);
+        # metrics are refreshed lazily by ScrapeTrigger on each scrape
+        start_http_server(EXPORTER_PORT, registry=REGISTRY)
+        print(f"Exporter running on http://0.0.0.0:{EXPORTER_PORT}/metrics")
 
-        time.sleep(SCRAPE_INTERVAL)
+        # Keep the event loop alive for scrape-triggered refreshes
+        await asyncio.Event().wait()
+
+
+def main():
+    """Main function"""
+    asyncio.run(main_async())
 
 
 if __name__ == '__main__':